@@ -1,15 +1,24 @@
 import sqlite3
 import os
 import datetime
-from tabulate import tabulate
 import time
-import json
+
+
+# ANSI escape codes to clear the terminal without spawning a shell
+CLEAR = "\033[2J\033[H"
+
+BOOK_HEADERS = ["ID", "Title", "Author", "Year", "Genre", "Status", "Date Added"]
+
+# Listing columns with the read status already rendered as a label by SQLite
+BOOK_COLUMNS = """id, title, author, publication_year, genre,
+    CASE read_status WHEN 1 THEN 'Read ✓' ELSE 'Unread ✗' END, added_date"""
 
 
 class LibraryManager:
-    def __init__(self, db_name="data.db"):
+    def __init__(self, db_name="data.db", ui_delay=0):
         """Initialize the library manager with a SQLite database"""
         self.db_name = db_name
+        self.ui_delay = ui_delay
         self.conn = None
         self.cursor = None
         self.connect_db()
@@ -18,9 +27,21 @@ class LibraryManager:
     def connect_db(self):
         """Connect to the SQLite database"""
         try:
-            
-            self.conn = sqlite3.connect(self.db_name)
+
+            self.conn = sqlite3.connect(self.db_name, cached_statements=256)
+            self.conn.row_factory = sqlite3.Row
             self.cursor = self.conn.cursor()
+
+            # Bind the long-lived cursor's methods once for every call site
+            self._exec = self.cursor.execute
+            self._exec_many = self.cursor.executemany
+
+            # WAL journaling makes each commit a single appended frame
+            self._exec("PRAGMA journal_mode=WAL")
+            self._exec("PRAGMA synchronous=NORMAL")
+            self._exec("PRAGMA busy_timeout=5000")
+            self._exec("PRAGMA temp_store=MEMORY")
+            self._exec("PRAGMA cache_size=-20000")
             print(f"Connected to database: {self.db_name}")
         except sqlite3.Error as e:
             print(f"Database connection error: {e}")
@@ -35,68 +56,75 @@ class LibraryManager:
             author TEXT NOT NULL,
             publication_year INTEGER,
             genre TEXT,
-            read_status BOOLEAN,
-            added_date TEXT
+            read_status INTEGER NOT NULL DEFAULT 0 CHECK(read_status IN (0, 1)),
+            added_date TEXT DEFAULT (datetime('now', 'localtime'))
         )
         '''
         try:
-            self.cursor.execute(create_table_query)
+            self._exec(create_table_query)
+
+            # NOCASE indexes serve case-insensitive LIKE prefixes and ORDER BY title
+            self._exec("CREATE INDEX IF NOT EXISTS idx_books_title ON books(title COLLATE NOCASE)")
+            self._exec("CREATE INDEX IF NOT EXISTS idx_books_author ON books(author COLLATE NOCASE)")
+            self._exec("CREATE INDEX IF NOT EXISTS idx_books_genre ON books(genre COLLATE NOCASE)")
             self.conn.commit()
         except sqlite3.Error as e:
             print(f"Database setup error: {e}")
 
+        # Reuse identical SQL strings so the statement cache always hits
+        self._sql_insert = '''
+        INSERT INTO books (title, author, publication_year, genre, read_status, added_date)
+        VALUES (?, ?, ?, ?, ?, datetime('now', 'localtime'))
+        '''
+        self._sql_import = '''
+        INSERT INTO books (title, author, publication_year, genre, read_status, added_date)
+        VALUES (?, ?, ?, ?, ?, ?)
+        '''
+        self._sql_delete = "DELETE FROM books WHERE id = ? RETURNING title"
+        self._sql_update_status = '''
+        UPDATE books SET read_status = CASE WHEN read_status THEN 0 ELSE 1 END
+        WHERE id = ? RETURNING title, read_status
+        '''
+        self._search_sql = {
+            "title": f"SELECT {BOOK_COLUMNS} FROM books WHERE title LIKE ? ORDER BY title COLLATE NOCASE",
+            "author": f"SELECT {BOOK_COLUMNS} FROM books WHERE author LIKE ? ORDER BY title COLLATE NOCASE",
+            "genre": f"SELECT {BOOK_COLUMNS} FROM books WHERE genre LIKE ? ORDER BY title COLLATE NOCASE",
+        }
+
     def add_book(self, title, author, publication_year, genre, read_status):
         """Add a new book to the library"""
         try:
-            added_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            query = '''
-            INSERT INTO books (title, author, publication_year, genre, read_status, added_date)
-            VALUES (?, ?, ?, ?, ?, ?)
-            '''
-            
-            self.cursor.execute(query, (title, author, publication_year, genre, read_status, added_date))
+            # SQLite stamps added_date itself
+            self._exec(self._sql_insert, (title, author, publication_year, genre, read_status))
             self.conn.commit()
             
-            print("\n✅ Book added successfully!")
-            time.sleep(1)
+            print("\n✅ Book added successfully!", flush=True)
+            if self.ui_delay:
+                time.sleep(self.ui_delay)
             return True
         except sqlite3.Error as e:
             print(f"Error adding book: {e}")
             return False
 
+    def _render_books(self, books, header, headers=BOOK_HEADERS):
+        """Print book rows as a table under the given header"""
+        # Imported on first use so paths that never draw a table start faster
+        from tabulate import tabulate
+
+        print(header)
+        print(tabulate(books, headers=headers, tablefmt="fancy_grid"))
+
     def view_all_books(self):
         """Display all books in the library"""
         try:
-            self.cursor.execute("SELECT * FROM books ORDER BY title")
+            self._exec(f"SELECT {BOOK_COLUMNS} FROM books ORDER BY title COLLATE NOCASE")
             books = self.cursor.fetchall()
             
             if not books:
                 print("\n📚 Your library is empty. Add some books to get started!")
                 return
             
-            # Prepare data for tabulate
-            headers = ["ID", "Title", "Author", "Year", "Genre", "Status", "Date Added"]
-            table_data = []
-            
-            for book in books:
-                # Format the read status
-                read_status = "Read ✓" if book[5] else "Unread ✗"
-                
-                # Add formatted row to table data
-                table_data.append([
-                    book[0],                  # ID
-                    book[1],                  # Title
-                    book[2],                  # Author
-                    book[3],                  # Publication Year
-                    book[4],                  # Genre
-                    read_status,              # Read Status
-                    book[6]                   # Added Date
-                ])
-            
-            # Display table
-            print("\n📚 Your Library:")
-            print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+            self._render_books(books, "\n📚 Your Library:")
             
         except sqlite3.Error as e:
             print(f"Error viewing books: {e}")
@@ -104,20 +132,17 @@ class LibraryManager:
     def remove_book(self, book_id):
         """Remove a book from the library by ID"""
         try:
-            # Check if book exists
-            self.cursor.execute("SELECT title FROM books WHERE id = ?", (book_id,))
-            book = self.cursor.fetchone()
+            # Delete the book and get its title back in the same statement
+            book = self._exec(self._sql_delete, (book_id,)).fetchone()
+            self.conn.commit()
             
             if not book:
                 print(f"\n❌ No book found with ID {book_id}")
                 return False
             
-            # Delete the book
-            self.cursor.execute("DELETE FROM books WHERE id = ?", (book_id,))
-            self.conn.commit()
-            
-            print(f"\n✅ Book '{book[0]}' removed successfully!")
-            time.sleep(1)
+            print(f"\n✅ Book '{book['title']}' removed successfully!", flush=True)
+            if self.ui_delay:
+                time.sleep(self.ui_delay)
             return True
             
         except sqlite3.Error as e:
@@ -127,63 +152,43 @@ class LibraryManager:
     def update_read_status(self, book_id):
         """Toggle the read status of a book"""
         try:
-            # Check if book exists and get current status
-            self.cursor.execute("SELECT title, read_status FROM books WHERE id = ?", (book_id,))
-            book = self.cursor.fetchone()
+            # Toggle the status and get the new value back in the same statement
+            book = self._exec(self._sql_update_status, (book_id,)).fetchone()
+            self.conn.commit()
             
             if not book:
                 print(f"\n❌ No book found with ID {book_id}")
                 return False
             
-            # Toggle status
-            new_status = not book[1]
-            status_text = "Read ✓" if new_status else "Unread ✗"
-            
-            # Update the book
-            self.cursor.execute("UPDATE books SET read_status = ? WHERE id = ?", (new_status, book_id))
-            self.conn.commit()
+            status_text = "Read ✓" if book['read_status'] else "Unread ✗"
             
-            print(f"\n✅ Status of '{book[0]}' updated to {status_text}")
-            time.sleep(1)
+            print(f"\n✅ Status of '{book['title']}' updated to {status_text}", flush=True)
+            if self.ui_delay:
+                time.sleep(self.ui_delay)
             return True
             
         except sqlite3.Error as e:
             print(f"Error updating book status: {e}")
             return False
 
-    def search_books(self, search_term, search_by):
+    def search_books(self, search_term, search_by, starts_with=False):
         """Search for books by title, author, or genre"""
         try:
-            query = f"SELECT * FROM books WHERE {search_by} LIKE ? ORDER BY title"
-            self.cursor.execute(query, (f"%{search_term}%",))
+            query = self._search_sql.get(search_by)
+            if query is None:
+                print(f"\n❌ Cannot search by '{search_by}'")
+                return
+
+            # A prefix pattern lets SQLite range-scan the column index
+            pattern = f"{search_term}%" if starts_with else f"%{search_term}%"
+            self._exec(query, (pattern,))
             books = self.cursor.fetchall()
             
             if not books:
                 print(f"\n🔍 No books found matching '{search_term}' in {search_by}")
                 return
             
-            # Prepare data for tabulate
-            headers = ["ID", "Title", "Author", "Year", "Genre", "Status", "Date Added"]
-            table_data = []
-            
-            for book in books:
-                # Format the read status
-                read_status = "Read ✓" if book[5] else "Unread ✗"
-                
-                # Add formatted row to table data
-                table_data.append([
-                    book[0],                  # ID
-                    book[1],                  # Title
-                    book[2],                  # Author
-                    book[3],                  # Publication Year
-                    book[4],                  # Genre
-                    read_status,              # Read Status
-                    book[6]                   # Added Date
-                ])
-            
-            # Display table
-            print(f"\n🔍 Search Results for '{search_term}' in {search_by}:")
-            print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+            self._render_books(books, f"\n🔍 Search Results for '{search_term}' in {search_by}:")
             
         except sqlite3.Error as e:
             print(f"Error searching books: {e}")
@@ -191,32 +196,47 @@ class LibraryManager:
     def get_statistics(self):
         """Calculate and display library statistics"""
         try:
-            # Total books
-            self.cursor.execute("SELECT COUNT(*) FROM books")
-            total_books = self.cursor.fetchone()[0]
+            # Gather every statistic in a single round trip, ordered within each kind;
+            # genres and authors are cut to the top five in SQL
+            self._exec('''
+            WITH b AS (SELECT genre, author, publication_year, read_status FROM books)
+            SELECT 'total', NULL, COUNT(*), 0 FROM b
+            UNION ALL
+            SELECT 'read', NULL, COUNT(*), 0 FROM b WHERE read_status = 1
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'genre', genre, COUNT(*), -COUNT(*) AS rank FROM b
+                GROUP BY genre ORDER BY rank LIMIT 5
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'author', author, COUNT(*), -COUNT(*) AS rank FROM b
+                GROUP BY author ORDER BY rank LIMIT 5
+            )
+            UNION ALL
+            SELECT 'decade', (publication_year / 10) * 10, COUNT(*), (publication_year / 10) * 10
+            FROM b WHERE publication_year IS NOT NULL GROUP BY 2
+            ORDER BY 1, 4
+            ''')
+
+            stats = {"total": [], "read": [], "genre": [], "author": [], "decade": []}
+            for kind, key, count, _ in self.cursor:
+                stats[kind].append((key, count))
+
+            total_books = stats["total"][0][1]
             
             if total_books == 0:
                 print("\n📊 Your library is empty. Add some books to see statistics!")
                 return
             
-            # Read books
-            self.cursor.execute("SELECT COUNT(*) FROM books WHERE read_status = 1")
-            read_books = self.cursor.fetchone()[0]
+            read_books = stats["read"][0][1]
             
             # Calculate percentage
             percent_read = (read_books / total_books * 100) if total_books > 0 else 0
             
-            # Get genre counts
-            self.cursor.execute("SELECT genre, COUNT(*) as count FROM books GROUP BY genre ORDER BY count DESC")
-            genres = self.cursor.fetchall()
-            
-            # Get author counts
-            self.cursor.execute("SELECT author, COUNT(*) as count FROM books GROUP BY author ORDER BY count DESC")
-            authors = self.cursor.fetchall()
-            
-            # Get decade counts
-            self.cursor.execute("SELECT (publication_year / 10) * 10 as decade, COUNT(*) FROM books GROUP BY decade ORDER BY decade")
-            decades = self.cursor.fetchall()
+            genres = stats["genre"]
+            authors = stats["author"]
+            decades = stats["decade"]
             
             # Display summary statistics
             print("\n📊 Library Statistics:")
@@ -227,21 +247,20 @@ class LibraryManager:
             # Display top genres
             if genres:
                 print("\nTop Genres:")
-                for genre, count in genres[:5]:
+                for genre, count in genres:
                     print(f"  {genre}: {count} book{'s' if count > 1 else ''}")
             
             # Display top authors
             if authors:
                 print("\nTop Authors:")
-                for author, count in authors[:5]:
+                for author, count in authors:
                     print(f"  {author}: {count} book{'s' if count > 1 else ''}")
             
             # Display books by decade
             if decades:
                 print("\nBooks by Decade:")
                 for decade, count in decades:
-                    if decade is not None:  # Skip None values
-                        print(f"  {decade}s: {count} book{'s' if count > 1 else ''}")
+                    print(f"  {decade}s: {count} book{'s' if count > 1 else ''}")
                 
         except sqlite3.Error as e:
             print(f"Error getting statistics: {e}")
@@ -249,28 +268,30 @@ class LibraryManager:
     def export_library(self, filename="library_export.json"):
         """Export the library to a JSON file"""
         try:
-            self.cursor.execute("SELECT * FROM books")
-            books = self.cursor.fetchall()
+            # SQLite builds each book's JSON object, so rows are written out as-is
+            self._exec('''
+            SELECT json_object(
+                'id', id, 'title', title, 'author', author,
+                'publication_year', publication_year, 'genre', genre,
+                'read_status', CASE read_status WHEN 1 THEN json('true') ELSE json('false') END,
+                'added_date', added_date
+            ) FROM books
+            ''')
+            book = self.cursor.fetchone()
             
-            if not books:
+            if book is None:
                 print("\n❌ Your library is empty. Nothing to export!")
                 return False
             
-            book_list = []
-            for book in books:
-                book_dict = {
-                    "id": book[0],
-                    "title": book[1],
-                    "author": book[2],
-                    "publication_year": book[3],
-                    "genre": book[4],
-                    "read_status": bool(book[5]),
-                    "added_date": book[6]
-                }
-                book_list.append(book_dict)
-            
-            with open(filename, 'w') as file:
-                json.dump(book_list, file, indent=4)
+            # Stream one row at a time instead of building the whole list in memory
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write("[")
+                separator = "\n    "
+                while book is not None:
+                    file.write(separator + book[0])
+                    separator = ",\n    "
+                    book = self.cursor.fetchone()
+                file.write("\n]")
             
             print(f"\n✅ Library exported successfully to {filename}")
             return True
@@ -281,12 +302,14 @@ class LibraryManager:
 
     def import_library(self, filename="library_export.json"):
         """Import library from a JSON file"""
+        import json
+
         try:
             if not os.path.exists(filename):
                 print(f"\n❌ File {filename} not found!")
                 return False
             
-            with open(filename, 'r') as file:
+            with open(filename, 'r', encoding='utf-8') as file:
                 books = json.load(file)
             
             if not books:
@@ -301,25 +324,24 @@ class LibraryManager:
                 print("Import cancelled.")
                 return False
             
-            # Clear current library
-            self.cursor.execute("DELETE FROM books")
-            
-            # Import books
-            for book in books:
-                query = '''
-                INSERT INTO books (title, author, publication_year, genre, read_status, added_date)
-                VALUES (?, ?, ?, ?, ?, ?)
-                '''
-                self.cursor.execute(query, (
-                    book['title'],
-                    book['author'],
-                    book['publication_year'],
-                    book['genre'],
-                    book['read_status'],
-                    book['added_date']
-                ))
-            
-            self.conn.commit()
+            # executemany pulls rows from the generator one at a time, so a
+            # malformed entry fails inside the transaction and is rolled back
+            rows = (
+                (book['title'], book['author'], book['publication_year'],
+                 book['genre'], int(bool(book['read_status'])), book['added_date'])
+                for book in books
+            )
+
+            # Replace the library in a single transaction
+            self._exec("BEGIN IMMEDIATE")
+            try:
+                self._exec("DELETE FROM books")
+                self._exec_many(self._sql_import, rows)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
             print(f"\n✅ Successfully imported {count} books!")
             return True
             
@@ -331,7 +353,23 @@ class LibraryManager:
         """Close the database connection"""
         if self.conn:
             self.conn.close()
-           
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+_GENRES = (
+    "Fiction", "Non-Fiction", "Science Fiction", "Fantasy",
+    "Mystery", "AI", "Codding", "Biography",
+    "History", "Self-Help", "Poetry", "Science",
+    "Philosophy", "Religion", "Art", "Other"
+)
+
+# The genre menu never changes, so it is built once at import time
+_GENRE_PROMPT = "\nSelect a genre:\n" + "\n".join(f"{i}. {genre}" for i, genre in enumerate(_GENRES, 1))
 
 
 def display_menu():
@@ -352,22 +390,13 @@ def display_menu():
 
 def get_genre_selection():
     """Display a menu for genre selection"""
-    genres = [
-        "Fiction", "Non-Fiction", "Science Fiction", "Fantasy", 
-        "Mystery", "AI", "Codding", "Biography", 
-        "History", "Self-Help", "Poetry", "Science", 
-        "Philosophy", "Religion", "Art", "Other"
-    ]
-    
-    print("\nSelect a genre:")
-    for i, genre in enumerate(genres, 1):
-        print(f"{i}. {genre}")
+    print(_GENRE_PROMPT)
     
     while True:
         try:
             choice = int(input("\nEnter genre number (1-16): "))
-            if 1 <= choice <= len(genres):
-                return genres[choice-1]
+            if 1 <= choice <= len(_GENRES):
+                return _GENRES[choice-1]
             else:
                 print("Invalid choice. Please enter a number between 1 and 16.")
         except ValueError:
@@ -376,145 +405,148 @@ def get_genre_selection():
 
 def main():
     """Main function to run the library manager"""
+    # Let legacy Windows consoles interpret ANSI escape codes
+    if os.name == 'nt':
+        os.system('')
+
     # Clear screen
-    os.system('cls' if os.name == 'nt' else 'clear')
+    print(CLEAR, end="")
     
     # Initialize library manager
-    library = LibraryManager()
-    
-    while True:
-        # Display menu and get choice
-        choice = display_menu()
-        
-        if choice == '1':
-            # View Library
-            os.system('cls' if os.name == 'nt' else 'clear')
-            library.view_all_books()
-            input("\nPress Enter to continue...")
-            
-        elif choice == '2':
-            # Add New Book
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print("\n📝 ADD NEW BOOK")
-            print("-" * 50)
-            
-            title = input("Enter book title: ")
-            if not title:
-                print("Title cannot be empty. Operation cancelled.")
-                continue
-                
-            author = input("Enter author name: ")
-            if not author:
-                print("Author cannot be empty. Operation cancelled.")
-                continue
-            
-            # Get publication year
-            while True:
-                try:
-                    year_input = input("Enter publication year (or press Enter for current year): ")
-                    if not year_input:
-                        publication_year = datetime.datetime.now().year
+    with LibraryManager() as library:
+
+        while True:
+            # Display menu and get choice
+            choice = display_menu()
+
+            if choice == '1':
+                # View Library
+                print(CLEAR, end="")
+                library.view_all_books()
+                input("\nPress Enter to continue...")
+
+            elif choice == '2':
+                # Add New Book
+                print(CLEAR, end="")
+                print("\n📝 ADD NEW BOOK")
+                print("-" * 50)
+
+                title = input("Enter book title: ")
+                if not title:
+                    print("Title cannot be empty. Operation cancelled.")
+                    continue
+
+                author = input("Enter author name: ")
+                if not author:
+                    print("Author cannot be empty. Operation cancelled.")
+                    continue
+
+                # Get publication year
+                current_year = datetime.datetime.now().year
+                while True:
+                    try:
+                        year_input = input("Enter publication year (or press Enter for current year): ")
+                        if not year_input:
+                            publication_year = current_year
+                        else:
+                            publication_year = int(year_input)
+                            if publication_year < 1000 or publication_year > current_year:
+                                print(f"Please enter a year between 1000 and {current_year}.")
+                                continue
+                        break
+                    except ValueError:
+                        print("Please enter a valid year.")
+
+                # Get genre
+                genre = get_genre_selection()
+
+                # Get read status
+                while True:
+                    read_input = input("Have you read this book? (y/n): ")
+                    if read_input.lower() in ['y', 'n']:
+                        read_status = read_input.lower() == 'y'
+                        break
                     else:
-                        publication_year = int(year_input)
-                        if publication_year < 1000 or publication_year > datetime.datetime.now().year:
-                            print(f"Please enter a year between 1000 and {datetime.datetime.now().year}.")
-                            continue
-                    break
+                        print("Please enter 'y' or 'n'.")
+
+                # Add the book
+                library.add_book(title, author, publication_year, genre, read_status)
+
+            elif choice == '3':
+                # Remove Book
+                print(CLEAR, end="")
+                library.view_all_books()
+
+                try:
+                    book_id = int(input("\nEnter the ID of the book to remove (or 0 to cancel): "))
+                    if book_id == 0:
+                        print("Operation cancelled.")
+                        continue
+                    library.remove_book(book_id)
                 except ValueError:
-                    print("Please enter a valid year.")
-            
-            # Get genre
-            genre = get_genre_selection()
-            
-            # Get read status
-            while True:
-                read_input = input("Have you read this book? (y/n): ")
-                if read_input.lower() in ['y', 'n']:
-                    read_status = read_input.lower() == 'y'
-                    break
+                    print("Please enter a valid book ID.")
+
+            elif choice == '4':
+                # Update Read Status
+                print(CLEAR, end="")
+                library.view_all_books()
+
+                try:
+                    book_id = int(input("\nEnter the ID of the book to update status (or 0 to cancel): "))
+                    if book_id == 0:
+                        print("Operation cancelled.")
+                        continue
+                    library.update_read_status(book_id)
+                except ValueError:
+                    print("Please enter a valid book ID.")
+
+            elif choice == '5':
+                # Search Books
+                print(CLEAR, end="")
+                print("\n🔍 SEARCH BOOKS")
+                print("-" * 50)
+
+                print("Search by:")
+                print("1. Title")
+                print("2. Author")
+                print("3. Genre")
+
+                search_option = input("Select an option (1-3): ")
+
+                if search_option == '1':
+                    search_by = "title"
+                elif search_option == '2':
+                    search_by = "author"
+                elif search_option == '3':
+                    search_by = "genre"
                 else:
-                    print("Please enter 'y' or 'n'.")
-            
-            # Add the book
-            library.add_book(title, author, publication_year, genre, read_status)
-            
-        elif choice == '3':
-            # Remove Book
-            os.system('cls' if os.name == 'nt' else 'clear')
-            library.view_all_books()
-            
-            try:
-                book_id = int(input("\nEnter the ID of the book to remove (or 0 to cancel): "))
-                if book_id == 0:
-                    print("Operation cancelled.")
+                    print("Invalid option. Returning to main menu.")
                     continue
-                library.remove_book(book_id)
-            except ValueError:
-                print("Please enter a valid book ID.")
-            
-        elif choice == '4':
-            # Update Read Status
-            os.system('cls' if os.name == 'nt' else 'clear')
-            library.view_all_books()
-            
-            try:
-                book_id = int(input("\nEnter the ID of the book to update status (or 0 to cancel): "))
-                if book_id == 0:
-                    print("Operation cancelled.")
+
+                search_term = input(f"\nEnter {search_by} to search: ")
+                if not search_term:
+                    print("Search term cannot be empty. Operation cancelled.")
                     continue
-                library.update_read_status(book_id)
-            except ValueError:
-                print("Please enter a valid book ID.")
-            
-        elif choice == '5':
-            # Search Books
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print("\n🔍 SEARCH BOOKS")
-            print("-" * 50)
-            
-            print("Search by:")
-            print("1. Title")
-            print("2. Author")
-            print("3. Genre")
-            
-            search_option = input("Select an option (1-3): ")
-            
-            if search_option == '1':
-                search_by = "title"
-            elif search_option == '2':
-                search_by = "author"
-            elif search_option == '3':
-                search_by = "genre"
+
+                starts_with = input("Only match the beginning? (y/n): ").lower() == 'y'
+
+                library.search_books(search_term, search_by, starts_with)
+                input("\nPress Enter to continue...")
+
+            elif choice == '6':
+                # View Statistics
+                print(CLEAR, end="")
+                library.get_statistics()
+                input("\nPress Enter to continue...")
+
+
+            elif choice == '9':
+                # Exit
+                print("\nThank you for using Personal Library Manager!")
+                break
+
             else:
-                print("Invalid option. Returning to main menu.")
-                continue
-            
-            search_term = input(f"\nEnter {search_by} to search: ")
-            if not search_term:
-                print("Search term cannot be empty. Operation cancelled.")
-                continue
-                
-            library.search_books(search_term, search_by)
-            input("\nPress Enter to continue...")
-            
-        elif choice == '6':
-            # View Statistics
-            os.system('cls' if os.name == 'nt' else 'clear')
-            library.get_statistics()
-            input("\nPress Enter to continue...")
-            
-      
-        elif choice == '9':
-            # Exit
-            print("\nThank you for using Personal Library Manager!")
-            library.close()
-            break
-            
-        else:
-            print("Invalid option. Please try again.")
-        
-        # Clear screen for next iteration
-        os.system('cls' if os.name == 'nt' else 'clear')
+                print("Invalid option. Please try again.")
 
 
 if __name__ == "__main__":